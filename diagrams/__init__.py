@@ -0,0 +1,18 @@
+import functools
+import shutil
+
+
+@functools.lru_cache(maxsize=None)
+def dot_path():
+    """Locate the Graphviz dot executable used to render frozen sources, None when it is not installed."""
+    return shutil.which("dot")
+
+
+def make_diagram(name=None, format="svg", engine="dot"):
+    """Create a digraph with the top-to-bottom layout shared by all diagrams."""
+    # Imported here so rendering frozen sources does not pay for the graphviz package
+    from graphviz import Digraph
+
+    diagram = Digraph(name, format=format, engine=engine)
+    diagram.attr(rankdir="TB", size="10,10")
+    return diagram
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from diagrams import make_diagram
+
+if TYPE_CHECKING:
+    from graphviz import Digraph
+
+# Same as graphviz quoting: a quote with an optional escaping backslash, after any escaped backslashes
+_QUOTE_WITH_OPTIONAL_BACKSLASH = re.compile(r'(?P<escaped_backslashes>(?:\\{2})*)\\?(?P<literal_quote>")')
+
+
+@dataclass(frozen=True, slots=True)
+class NodeSpec:
+    name: str
+    label: str
+    shape: str
+    fillcolor: str
+    style: str = "filled"
+
+
+@dataclass(frozen=True, slots=True)
+class EdgeSpec:
+    tail: str
+    head: str
+    label: str | None = None
+    style: str | None = None
+
+
+STRATEGY_NODE_SPECS: tuple[NodeSpec, ...] = (
+    NodeSpec("Start", "Start Opportunity Scan", "ellipse", "lightgrey"),
+    NodeSpec("FetchPrices", "Fetch Token Prices\nfrom Uniswap API", "box", "lightblue"),
+    NodeSpec("IdentifyOpportunity", "Identify Arbitrage\nOpportunities", "diamond", "lightyellow"),
+    NodeSpec("InitiateFlashLoan", "Initiate Flash Loan\nfrom AAVE", "box", "lightgreen"),
+    NodeSpec("FirstSwap", "Swap Token A to Token B\non Uniswap", "box", "lightblue"),
+    NodeSpec("SecondSwap", "Swap Token B to Token C\non Uniswap", "box", "lightblue"),
+    NodeSpec("ThirdSwap", "Swap Token C to Token A\non Uniswap", "box", "lightblue"),
+    NodeSpec("RepayLoan", "Repay Flash Loan\nand Retain Profit", "box", "lightgreen"),
+    NodeSpec("End", "End Process", "ellipse", "lightgrey"),
+)
+
+STRATEGY_EDGE_SPECS: tuple[EdgeSpec, ...] = (
+    EdgeSpec("Start", "FetchPrices"),
+    EdgeSpec("FetchPrices", "IdentifyOpportunity"),
+    EdgeSpec("IdentifyOpportunity", "InitiateFlashLoan", label="Profitable", style="solid"),
+    EdgeSpec("IdentifyOpportunity", "End", label="Not Profitable", style="dashed"),
+    EdgeSpec("InitiateFlashLoan", "FirstSwap"),
+    EdgeSpec("FirstSwap", "SecondSwap"),
+    EdgeSpec("SecondSwap", "ThirdSwap"),
+    EdgeSpec("ThirdSwap", "RepayLoan"),
+    EdgeSpec("RepayLoan", "End"),
+)
+
+SYSTEM_NODE_SPECS: tuple[NodeSpec, ...] = (
+    NodeSpec("Controller", "Controller\n(Continuous Opportunity Scan)", "box", "lightblue"),
+    NodeSpec("SmartContracts", "Smart Contracts", "box", "lightgreen"),
+    NodeSpec("DataSources", "Data Sources\n(DEX APIs, etc.)", "box", "lightblue"),
+    NodeSpec("DEX", "DEX", "box", "lightyellow"),
+    NodeSpec("FlashLoanProvider", "Flash Loan Provider\n(Lending Pool)", "box", "lightyellow"),
+)
+
+SYSTEM_EDGE_SPECS: tuple[EdgeSpec, ...] = (
+    EdgeSpec("Controller", "SmartContracts"),
+    EdgeSpec("Controller", "DataSources"),
+    EdgeSpec("SmartContracts", "FlashLoanProvider"),
+    EdgeSpec("SmartContracts", "DEX"),
+)
+
+
+def _quote(value):
+    # Quote every ID and value so keywords, spaces and dashes stay valid DOT. Only unescaped double quotes are
+    # escaped, label escapes such as \l and \N pass through as they do with Digraph.node()
+    escaped = _QUOTE_WITH_OPTIONAL_BACKSLASH.sub(r"\g<escaped_backslashes>\\\g<literal_quote>", value)
+    return f'"{escaped}"'
+
+
+def _attr_list(label, attrs):
+    items = [f"{key}={_quote(value)}" for key, value in (("label", label), *attrs) if value is not None]
+    return f" [{' '.join(items)}]" if items else ""
+
+
+def _node_line(node: NodeSpec) -> str:
+    attrs = (("fillcolor", node.fillcolor), ("shape", node.shape), ("style", node.style))
+    return f"\t{_quote(node.name)}{_attr_list(node.label, attrs)}\n"
+
+
+def _edge_line(edge: EdgeSpec) -> str:
+    return f"\t{_quote(edge.tail)} -> {_quote(edge.head)}{_attr_list(edge.label, (('style', edge.style),))}\n"
+
+
+def build(name: str, nodes: tuple[NodeSpec, ...], edges: tuple[EdgeSpec, ...], format="svg", engine="dot") -> Digraph:
+    """Create a top-to-bottom digraph populated from node and edge specs.
+
+    The DOT statements are formatted in one pass and appended to the body in a single batch.
+    """
+    diagram = make_diagram(name, format=format, engine=engine)
+    diagram.body.extend([_node_line(node) for node in nodes] + [_edge_line(edge) for edge in edges])
+    return diagram
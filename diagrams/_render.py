@@ -0,0 +1,95 @@
+import hashlib
+import os
+import re
+import subprocess
+
+from diagrams import dot_path
+
+_GEOMETRY_ATTRIBUTE = re.compile(r'(?<=\s)(?:points|d|x|y|width|height|viewBox|transform|cx|cy|rx|ry)="[^"]*"')
+_LONG_DECIMAL = re.compile(r"(\d+\.\d{3,})")
+_INTER_TAG_WHITESPACE = re.compile(r">\s+<")
+
+
+def _digest(source, engine, format):
+    # The DOT source alone does not capture how it is laid out or written
+    spec = f"{engine}\n{format}\n{source}"
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+
+def _is_cached(digest, path, format):
+    hash_path = f"{path}.hash"
+    if not os.path.exists(f"{path}.{format}") or not os.path.exists(hash_path):
+        return False
+    with open(hash_path, encoding="utf-8") as hash_file:
+        return hash_file.read().strip() == digest
+
+
+def _store_digest(digest, path):
+    with open(f"{path}.hash", "w", encoding="utf-8") as hash_file:
+        hash_file.write(digest)
+
+
+def _require_dot():
+    if dot_path() is None:
+        raise RuntimeError("Graphviz is not installed, the dot executable is required to render diagrams")
+
+
+def _round(match):
+    return f"{float(match.group(1)):.2f}"
+
+
+def _compact_svg(svg_path):
+    with open(svg_path, encoding="utf-8") as svg_file:
+        svg = svg_file.read()
+    # Only geometry attributes are rounded, tooltips, links, text, comments and the prolog are left untouched
+    svg = _GEOMETRY_ATTRIBUTE.sub(lambda value: _LONG_DECIMAL.sub(_round, value.group(0)), svg)
+    svg = _INTER_TAG_WHITESPACE.sub("><", svg)
+    with open(svg_path, "w", encoding="utf-8") as svg_file:
+        svg_file.write(svg)
+
+
+def render_compact(diagram, path):
+    """Render the diagram and, for SVG output, shrink the emitted file.
+
+    Coordinates are rounded to two decimals and whitespace between tags is dropped.
+    Returns the path of the rendered file.
+    """
+    output_path = diagram.render(path)
+    if diagram.format == "svg":
+        _compact_svg(output_path)
+    return output_path
+
+
+def render_if_changed(diagram, path):
+    """Render the diagram only when its specification changed since the last render.
+
+    The digest of the last rendered specification is kept in a ``<path>.hash`` sidecar file.
+    Returns True when the diagram was rendered, False when the cached output was reused.
+    """
+    digest = _digest(diagram.source, diagram.engine, diagram.format)
+    if _is_cached(digest, path, diagram.format):
+        return False
+
+    render_compact(diagram, path)
+    _store_digest(digest, path)
+    return True
+
+
+def render_frozen(path, format="svg", engine="dot"):
+    """Render the DOT source saved at ``path`` straight through the dot executable, without the graphviz package.
+
+    Shares the ``<path>.hash`` cache with render_if_changed.
+    Returns True when the diagram was rendered, False when the cached output was reused.
+    """
+    with open(path, encoding="utf-8") as source_file:
+        digest = _digest(source_file.read(), engine, format)
+    if _is_cached(digest, path, format):
+        return False
+
+    _require_dot()
+    output_path = f"{path}.{format}"
+    subprocess.run([dot_path(), f"-K{engine}", f"-T{format}", "-o", output_path, path], check=True)
+    if format == "svg":
+        _compact_svg(output_path)
+    _store_digest(digest, path)
+    return True
@@ -0,0 +1,26 @@
+# Run from the repository root: python -m diagrams.build_all
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from diagrams import strategy_overview, system_overview
+from diagrams._render import render_if_changed
+
+DIAGRAM_MODULES = (strategy_overview, system_overview)
+
+
+def build_all():
+    """Render every diagram in parallel, each thread waits on its own dot subprocess.
+
+    Returns the paths of the diagrams that had to be re-rendered.
+    """
+    diagrams = [module.create_diagram() for module in DIAGRAM_MODULES]
+    paths = [module.file_path for module in DIAGRAM_MODULES]
+    workers = min(len(diagrams), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        rendered = executor.map(render_if_changed, diagrams, paths)
+    return [path for path, was_rendered in zip(paths, rendered) if was_rendered]
+
+
+if __name__ == "__main__":
+    for path in build_all():
+        print(f"Rendered {path}")
@@ -0,0 +1,43 @@
+# Run from the repository root:
+#   python -m diagrams.freeze           write the DOT sources, requires the graphviz package
+#   python -m diagrams.freeze --render  render the saved DOT sources, requires only the dot executable
+# The DOT source of each diagram is the <name>.digraph file Digraph.render also writes, so every render refreshes it
+import argparse
+
+from diagrams._render import render_frozen
+from diagrams.build_all import DIAGRAM_MODULES
+
+
+def freeze():
+    """Write the DOT source of every diagram to its file path. Returns the written paths."""
+    paths = []
+    for module in DIAGRAM_MODULES:
+        with open(module.file_path, "w", encoding="utf-8") as source_file:
+            source_file.write(module.create_diagram().source)
+        paths.append(module.file_path)
+    return paths
+
+
+def render_all_frozen():
+    """Render every saved DOT source with its diagram's render options.
+
+    Returns the paths of the diagrams that had to be re-rendered.
+    """
+    return [
+        module.file_path
+        for module in DIAGRAM_MODULES
+        if render_frozen(module.file_path, **module.render_options())
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Freeze or render the static diagram DOT sources.")
+    parser.add_argument("--render", action="store_true", help="render the saved sources instead of writing them")
+    args = parser.parse_args()
+
+    if args.render:
+        for path in render_all_frozen():
+            print(f"Rendered {path}")
+    else:
+        for path in freeze():
+            print(f"Froze {path}")
@@ -1,22 +1,23 @@
-from graphviz import Digraph
-
-# Create a directed graph
-diagram = Digraph(format="svg")
-diagram.attr(rankdir="TB", size="10,10")
-
-# Define nodes
-diagram.node("Controller", "Controller\n(Continuous Opportunity Scan)", shape="box", style="filled", fillcolor="lightblue")
-diagram.node("SmartContracts", "Smart Contracts", shape="box", style="filled", fillcolor="lightgreen")
-diagram.node("DataSources", "Data Sources\n(DEX APIs, etc.)", shape="box", style="filled", fillcolor="lightblue")
-diagram.node("DEX", "DEX", shape="box", style="filled", fillcolor="lightyellow")
-diagram.node("FlashLoanProvider", "Flash Loan Provider\n(Lending Pool)", shape="box", style="filled", fillcolor="lightyellow")
-
-# Define edges
-diagram.edge("Controller", "SmartContracts")
-diagram.edge("Controller", "DataSources")
-diagram.edge("SmartContracts", "FlashLoanProvider")
-diagram.edge("SmartContracts", "DEX")
-
-# Render and save
-diagram_path = "diagrams/system_overview.digraph"
-diagram.render(diagram_path)
\ No newline at end of file
+# Run from the repository root: python -m diagrams.system_overview
+# Set GV_FORMAT=png to rasterize through Cairo instead of the SVG writer as the diagram grows
+# Set GV_ENGINE=sfdp to use the multilevel force-directed layout once dot gets too slow
+import os
+
+from diagrams._build import SYSTEM_EDGE_SPECS, SYSTEM_NODE_SPECS, build
+from diagrams._render import render_if_changed
+
+file_path = "diagrams/system_overview.digraph"
+
+
+def render_options():
+    return {"format": os.environ.get("GV_FORMAT", "svg"), "engine": os.environ.get("GV_ENGINE", "dot")}
+
+
+def create_diagram():
+    # Create a directed graph
+    return build("system_overview", SYSTEM_NODE_SPECS, SYSTEM_EDGE_SPECS, **render_options())
+
+
+if __name__ == "__main__":
+    # Render and save
+    render_if_changed(create_diagram(), file_path)
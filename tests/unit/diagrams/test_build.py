@@ -0,0 +1,21 @@
+from diagrams._build import EdgeSpec, NodeSpec, build
+
+
+def test_ids_are_quoted_and_bare_quotes_escaped():
+    diagram = build(
+        "test",
+        (
+            NodeSpec("Node", 'Say "hi"', "box", "lightblue"),
+            NodeSpec("Flash Loan-Provider", "Lender", "box", "lightblue"),
+        ),
+        (EdgeSpec("Node", "Flash Loan-Provider", label="Profitable"),),
+    )
+
+    assert '\t"Node" [label="Say \\"hi\\"" fillcolor="lightblue" shape="box" style="filled"]\n' in diagram.body
+    assert '\t"Node" -> "Flash Loan-Provider" [label="Profitable"]\n' in diagram.body
+
+
+def test_label_escapes_pass_through():
+    diagram = build("test", (NodeSpec("Left", "left\\lright\\l", "box", "lightblue"),), ())
+
+    assert '\t"Left" [label="left\\lright\\l" fillcolor="lightblue" shape="box" style="filled"]\n' in diagram.body
@@ -0,0 +1,56 @@
+from xml.dom import minidom
+
+from diagrams._render import _compact_svg
+
+SVG = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"
+ "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">
+<!-- Generated by graphviz version 12.2.0 (20241103.1931)
+ -->
+<svg width="269pt" height="203pt"
+ viewBox="0.00 0.00 268.8765 203.004" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
+<g id="graph0" class="graph">
+<polygon fill="white" stroke="none" points="-4,4 -4,-199.1234 264.88,-199.1234"/>
+<text x="143" y="-177.7">Fee 0.0005 "quoted"</text>
+<g id="a_node1"><a xlink:href="https://example.com/pool?fee=0.0005" xlink:title="fee 0.0005">
+<ellipse cx="153.3812" cy="-693.5" rx="96.394" ry="18"/>
+</a></g>
+</g>
+</svg>
+"""
+
+
+def _compact(tmp_path, svg):
+    svg_path = tmp_path / "diagram.svg"
+    svg_path.write_text(svg, encoding="utf-8")
+    _compact_svg(str(svg_path))
+    return svg_path.read_text(encoding="utf-8")
+
+
+def test_rounds_coordinates_in_attributes(tmp_path):
+    svg = _compact(tmp_path, SVG)
+
+    assert 'viewBox="0.00 0.00 268.88 203.00"' in svg
+    assert 'points="-4,4 -4,-199.12 264.88,-199.12"' in svg
+    assert 'cx="153.38" cy="-693.5" rx="96.39"' in svg
+
+
+def test_leaves_text_and_comments_untouched(tmp_path):
+    svg = _compact(tmp_path, SVG)
+
+    assert '<text x="143" y="-177.7">Fee 0.0005 "quoted"</text>' in svg
+    assert "(20241103.1931)" in svg
+
+
+def test_leaves_tooltips_and_links_untouched(tmp_path):
+    svg = _compact(tmp_path, SVG)
+
+    assert 'xlink:href="https://example.com/pool?fee=0.0005" xlink:title="fee 0.0005"' in svg
+
+
+def test_drops_whitespace_between_tags_and_stays_valid(tmp_path):
+    svg = _compact(tmp_path, SVG)
+
+    assert "><g" in svg and "\n<" not in svg
+    document = minidom.parseString(svg)
+    assert document.documentElement.tagName == "svg"
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from diagrams import _render, strategy_overview, system_overview
+from diagrams.build_all import DIAGRAM_MODULES
+from diagrams.freeze import render_all_frozen
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+@pytest.mark.parametrize("module", DIAGRAM_MODULES, ids=lambda module: module.__name__)
+def test_saved_source_matches_specs(module):
+    with open(os.path.join(REPO_ROOT, module.file_path), encoding="utf-8") as source_file:
+        assert source_file.read() == module.create_diagram().source, "run python -m diagrams.freeze"
+
+
+def test_render_all_frozen_uses_diagram_render_options(tmp_path, monkeypatch):
+    commands = []
+
+    def fake_run(command, check):
+        commands.append(command)
+        with open(command[command.index("-o") + 1], "w", encoding="utf-8") as output_file:
+            output_file.write("<svg/>")
+
+    for module in (strategy_overview, system_overview):
+        path = str(tmp_path / os.path.basename(module.file_path))
+        with open(path, "w", encoding="utf-8") as source_file:
+            source_file.write(module.create_diagram().source)
+        monkeypatch.setattr(module, "file_path", path)
+    monkeypatch.setattr(_render, "dot_path", lambda: "dot")
+    monkeypatch.setattr(_render.subprocess, "run", fake_run)
+    monkeypatch.setenv("GV_ENGINE", "sfdp")
+
+    render_all_frozen()
+
+    assert [command[1] for command in commands] == ["-Kdot", "-Ksfdp"]
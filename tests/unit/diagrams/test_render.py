@@ -0,0 +1,49 @@
+import pytest
+
+from diagrams import make_diagram
+from diagrams._render import render_if_changed
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    rendered = []
+
+    def fake_render(self, path):
+        rendered.append((path, self.engine, self.format))
+        output_path = f"{path}.{self.format}"
+        with open(output_path, "w", encoding="utf-8") as output_file:
+            output_file.write("<svg/>")
+        return output_path
+
+    monkeypatch.setattr("graphviz.Digraph.render", fake_render)
+    return rendered
+
+
+def _diagram(format="svg", engine="dot"):
+    diagram = make_diagram("test", format=format, engine=engine)
+    diagram.node("A")
+    return diagram
+
+
+def test_first_render_renders(tmp_path, renders):
+    path = str(tmp_path / "test.digraph")
+
+    assert render_if_changed(_diagram(), path)
+    assert renders == [(path, "dot", "svg")]
+
+
+def test_unchanged_diagram_is_skipped(tmp_path, renders):
+    path = str(tmp_path / "test.digraph")
+    render_if_changed(_diagram(), path)
+
+    assert not render_if_changed(_diagram(), path)
+    assert len(renders) == 1
+
+
+@pytest.mark.parametrize("options", [{"engine": "sfdp"}, {"format": "png"}])
+def test_engine_or_format_change_rerenders(tmp_path, renders, options):
+    path = str(tmp_path / "test.digraph")
+    render_if_changed(_diagram(), path)
+
+    assert render_if_changed(_diagram(**options), path)
+    assert len(renders) == 2